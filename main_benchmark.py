@@ -0,0 +1,65 @@
+import os
+import sys
+
+from src.benchmark import BenchmarkRunner
+
+FULL_RUN = False
+SCENARIOS = [
+    {"events": 10_000, "tasks": 1_000},
+    {"events": 100_000, "tasks": 10_000},
+]
+FULL_SCENARIOS = SCENARIOS + [
+    {"events": 100_000, "tasks": 100_000, "max_tasks_per_day": 20_000},
+]
+REPEATS = 3
+RESULTS_FILE = "benchmark_results.json"
+BASELINE_FILE = "benchmark_baseline.json"
+
+
+def display_results(results):
+    """Displays the minimum and median timings and API calls for every benchmark."""
+    for scenario, benchmarks in results["results"].items():
+        print(f"\n{scenario}")
+        print(f"  {'benchmark':<28} {'min':>11} {'median':>11}  api calls")
+        for name, result in benchmarks.items():
+            api_calls = ", ".join(
+                f"{call}={count}" for call, count in sorted(result["api_calls"].items())
+            )
+            if not result["api_calls_consistent"]:
+                api_calls += "  (differs between repeats)"
+            print(
+                f"  {name:<28} {result['min_seconds']:>10.4f}s "
+                f"{result['median_seconds']:>10.4f}s  {api_calls or '-'}"
+            )
+
+
+def main():
+    """
+    Main function to run the offline benchmark suite and compare it with a baseline.
+
+    Results are saved to RESULTS_FILE. If BASELINE_FILE exists, regressions beyond its
+    thresholds are reported and the script exits with a non-zero status.
+    """
+    runner = BenchmarkRunner(
+        FULL_SCENARIOS if FULL_RUN else SCENARIOS, repeats=REPEATS
+    )
+    results = runner.run()
+    display_results(results)
+    runner.save_results(results, RESULTS_FILE)
+    print(f"\nResults have been saved to {RESULTS_FILE}.")
+
+    if not os.path.exists(BASELINE_FILE):
+        print(f"No baseline found at {BASELINE_FILE}, skipping comparison.")
+        return
+
+    regressions = runner.compare_results(runner.load_results(BASELINE_FILE), results)
+    if regressions:
+        print("\nRegressions:")
+        for regression in regressions:
+            print(f"- {regression}")
+        sys.exit(1)
+    print("No regressions found.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,540 @@
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import tempfile
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+from src.data_presenter import DataPresenter
+from src.google_calendar import GoogleCalendar
+from src.request_scheduler import RequestScheduler
+from src.task_scheduler import TaskScheduler
+
+DEFAULT_THRESHOLDS = {
+    "time_ratio": 1.25,
+    "min_time_delta_seconds": 0.005,
+    "api_calls_ratio": 1.0,
+    "benchmarks": {},
+}
+
+
+class FakeGoogleCalendar:
+    """In-memory stand-in for GoogleCalendar that records every API call it receives."""
+
+    def __init__(self) -> None:
+        """Initializes an empty calendar indexed by event date."""
+        self.events_by_date = defaultdict(dict)
+        self.event_dates = {}
+        self.api_calls = Counter()
+        self._next_id = 0
+
+    def create_event(self, summary, description, start_time, end_time):
+        """Creates a new event, mirroring GoogleCalendar.create_event."""
+        self.api_calls["create_event"] += 1
+        return self.add_event(summary, description, start_time, end_time)
+
+    def update_event(self, event_id, update_body):
+        """Replaces an existing event body, mirroring GoogleCalendar.update_event."""
+        self.api_calls["update_event"] += 1
+        event = dict(update_body, id=event_id)
+        self.remove_event(event_id)
+        self.store_event(event)
+        return event
+
+    def delete_event(self, event_id):
+        """Deletes an event, mirroring GoogleCalendar.delete_event."""
+        self.api_calls["delete_event"] += 1
+        self.remove_event(event_id)
+
+    def get_events(self, start_date, end_date):
+        """Returns events starting within the given range, mirroring GoogleCalendar.get_events."""
+        self.api_calls["get_events"] += 1
+        return self.find_events(start_date, end_date)
+
+    def find_events(self, start_date, end_date):
+        """Returns events starting within the given range without counting an API call."""
+        start_day = datetime.fromisoformat(start_date).date()
+        end_day = datetime.fromisoformat(end_date).date()
+        events = []
+        while start_day <= end_day:
+            day_events = self.events_by_date.get(start_day.isoformat(), {})
+            events.extend(
+                event
+                for event in day_events.values()
+                if start_date <= event["start"]["dateTime"] < end_date
+            )
+            start_day += timedelta(days=1)
+        return sorted(events, key=lambda event: event["start"]["dateTime"])
+
+    def add_event(self, summary, description, start_time, end_time, color_id="8"):
+        """Stores an event without counting it as an API call, used to seed synthetic data."""
+        event = {
+            "id": self.next_event_id(),
+            "summary": summary,
+            "description": description,
+            "start": {"dateTime": start_time, "timeZone": "Europe/Warsaw"},
+            "end": {"dateTime": end_time, "timeZone": "Europe/Warsaw"},
+            "colorId": color_id,
+        }
+        self.store_event(event)
+        return event
+
+    def next_event_id(self) -> str:
+        """Returns a new unique ID for an event created in the calendar."""
+        self._next_id += 1
+        return f"event{self._next_id}"
+
+    def get_event(self, event_id):
+        """Returns a stored event by its ID, or None if it does not exist."""
+        date_str = self.event_dates.get(event_id)
+        if date_str is None:
+            return None
+        return self.events_by_date[date_str][event_id]
+
+    def reset_api_calls(self) -> None:
+        """Clears the recorded API call counters."""
+        self.api_calls.clear()
+
+    def store_event(self, event):
+        """Stores an event indexed by the date of its start time, without counting an API call."""
+        date_str = event["start"]["dateTime"][:10]
+        self.events_by_date[date_str][event["id"]] = event
+        self.event_dates[event["id"]] = date_str
+
+    def remove_event(self, event_id):
+        """Removes an event from the date index, without counting an API call."""
+        date_str = self.event_dates.pop(event_id)
+        del self.events_by_date[date_str][event_id]
+
+
+class FakeServiceRequest:
+    """Request returned by FakeCalendarService, counting the API call when it is executed."""
+
+    def __init__(self, service, method: str, action: Callable) -> None:
+        """Initializes the request with the service, API method name and the action to run."""
+        self.service = service
+        self.method = method
+        self.action = action
+
+    def execute(self):
+        """Records the API call and runs the action against the in-memory calendar."""
+        self.service.api_calls[self.method] += 1
+        return self.action()
+
+
+class FakeCalendarService:
+    """
+    Stand-in for the googleapiclient Calendar service backed by a FakeGoogleCalendar, so that
+    benchmarks run the real GoogleCalendar and RequestScheduler code and count calls at the
+    service layer.
+    """
+
+    def __init__(self, calendar: FakeGoogleCalendar) -> None:
+        """Initializes the service with the in-memory calendar it reads and writes."""
+        self.calendar = calendar
+        self.api_calls = Counter()
+
+    def events(self):
+        """Returns the events resource, mirroring service.events()."""
+        return self
+
+    def list(self, calendarId, timeMin, timeMax, **kwargs):
+        """Lists events starting within the given range."""
+        return FakeServiceRequest(
+            self,
+            "events.list",
+            lambda: {"items": self.calendar.find_events(timeMin, timeMax)},
+        )
+
+    def get(self, calendarId, eventId):
+        """Gets a single event by its ID."""
+        return FakeServiceRequest(
+            self, "events.get", lambda: self.calendar.get_event(eventId)
+        )
+
+    def insert(self, calendarId, body):
+        """Inserts an event, keeping a client-generated ID if the body has one."""
+
+        def action():
+            event = dict(body)
+            if "id" not in event:
+                event["id"] = self.calendar.next_event_id()
+            self.calendar.store_event(event)
+            return event
+
+        return FakeServiceRequest(self, "events.insert", action)
+
+    def update(self, calendarId, eventId, body):
+        """Replaces the body of an existing event."""
+
+        def action():
+            event = dict(body, id=eventId)
+            self.calendar.remove_event(eventId)
+            self.calendar.store_event(event)
+            return event
+
+        return FakeServiceRequest(self, "events.update", action)
+
+    def delete(self, calendarId, eventId):
+        """Deletes an event."""
+        return FakeServiceRequest(
+            self, "events.delete", lambda: self.calendar.remove_event(eventId)
+        )
+
+    def reset_api_calls(self) -> None:
+        """Clears the recorded API call counters."""
+        self.api_calls.clear()
+
+
+class SyntheticDataGenerator:
+    """Builds reproducible synthetic calendars, task decks and history files for benchmarking."""
+
+    TOPICS = [
+        "Linux",
+        "Python",
+        "Docker",
+        "Kubernetes",
+        "SQL",
+        "Git",
+        "Networking",
+        "Algorithms",
+    ]
+    OTHER_SUMMARIES = ["Meeting", "Lot: WAW - KRK", "Gym", "Lunch", "Call"]
+    MAX_DESCRIPTION_ITEMS = 20
+    TASK_EVENT_DAY_RATIO = 0.6
+
+    def __init__(self, seed: int = 0) -> None:
+        """Initializes the generator with a fixed seed so runs are comparable."""
+        self.random = random.Random(seed)
+
+    def build_config(self, start_date: str, max_tasks_per_day: int, tasks: List[str]):
+        """Builds a task scheduler configuration matching the layout of config.yaml."""
+        return {
+            "event_name": "#Zadania",
+            "task_phrase": "Zadania",
+            "history_dir": "history",
+            "max_tasks_per_day": max_tasks_per_day,
+            "event_time": {"start": "8:00", "end": "9:00"},
+            "start_date": start_date,
+            "intervals": [[1, 1], [2, 4], [9, 16], [30, 35]],
+            "avoid_days": {"weekdays": [6], "dates": []},
+            "tasks": tasks,
+        }
+
+    def build_deck(self, n_tasks: int) -> List[str]:
+        """Builds a list of unique task names."""
+        return [
+            f"{self.TOPICS[index % len(self.TOPICS)]} {index}"
+            for index in range(n_tasks)
+        ]
+
+    def build_calendar(
+        self,
+        calendar: FakeGoogleCalendar,
+        n_events: int,
+        start_date: datetime,
+        events_per_day: int,
+        max_tasks_per_day: int,
+    ) -> List[str]:
+        """
+        Fills the calendar with unrelated events and, on a share of days given by
+        TASK_EVENT_DAY_RATIO, a task event, returning task event descriptions. Days without a
+        task event make the add and undo flows create and delete events as well as update them.
+        """
+        descriptions = []
+        n_days = max(1, n_events // events_per_day)
+        for day in range(n_days):
+            date = start_date + timedelta(days=day)
+            has_task_event = self.random.random() < self.TASK_EVENT_DAY_RATIO
+            for slot in range(events_per_day):
+                start_time = date.replace(hour=7 + slot % 14, minute=0).isoformat()
+                end_time = date.replace(hour=7 + slot % 14, minute=30).isoformat()
+                if slot == 0 and has_task_event:
+                    description = self.build_task_description(day, max_tasks_per_day)
+                    descriptions.append(description)
+                    calendar.add_event("#Zadania", description, start_time, end_time)
+                else:
+                    calendar.add_event(
+                        self.random.choice(self.OTHER_SUMMARIES),
+                        self.build_other_description(),
+                        start_time,
+                        end_time,
+                    )
+        return descriptions
+
+    def build_task_description(self, day: int, max_tasks_per_day: int) -> str:
+        """
+        Builds a task event description with a varied number of items, alternating between
+        HTML lists as edited in the Google Calendar UI and dash lists as written by TaskScheduler.
+        """
+        n_items = self.random.randint(
+            1, min(max_tasks_per_day, self.MAX_DESCRIPTION_ITEMS)
+        )
+        task_names = [
+            f"{self.random.choice(self.TOPICS)} {self.random.randint(0, 9999)}"
+            for _ in range(n_items)
+        ]
+        if day % 2:
+            items = "".join(
+                f"<li><b>{name}</b><br>rozdział {index + 1}</li>"
+                for index, name in enumerate(task_names)
+            )
+            return (
+                f"<p><b>Powtórka</b> dzień {day}</p><ul>{items}</ul>"
+                "<p>Notatki:<br><i>zaległe z poprzedniego tygodnia</i></p>"
+            )
+        return "\n".join(f"- {name}" for name in task_names)
+
+    def build_other_description(self) -> str:
+        """Builds an HTML description for an event unrelated to tasks."""
+        return (
+            '<p>Details: <a href="https://example.com/agenda">agenda</a></p>'
+            "<p>Notes:<br>bring laptop<br>check email</p>"
+        )
+
+    def build_history_files(
+        self, history_dir: str, scheduled_tasks: Dict[str, List[str]], n_files: int
+    ) -> List[str]:
+        """Splits scheduled tasks into history files in the format written by TaskScheduler."""
+        dates = sorted(scheduled_tasks)
+        chunk_size = max(1, -(-len(dates) // n_files))
+        files = []
+        for index in range(0, len(dates), chunk_size):
+            records = [
+                {
+                    "date": date_str,
+                    "tasks": scheduled_tasks[date_str],
+                    "updated_existing_event": self.random.random() < 0.5,
+                }
+                for date_str in dates[index : index + chunk_size]
+            ]
+            file_name = f"{20240101000000 + len(files)}.yaml"
+            with open(os.path.join(history_dir, file_name), "w") as file:
+                yaml.dump(records, file)
+            files.append(file_name)
+        return sorted(files, reverse=True)
+
+
+class BenchmarkRunner:
+    """Times scheduler, parsing, rendering and undo paths against synthetic data without network access."""
+
+    def __init__(
+        self,
+        scenarios: List[Dict[str, int]],
+        repeats: int = 3,
+        thresholds: Optional[Dict[str, Any]] = None,
+        seed: int = 0,
+    ) -> None:
+        """Initializes the runner with scenario sizes, repeat count and regression thresholds."""
+        self.scenarios = scenarios
+        self.repeats = repeats
+        self.thresholds = thresholds or dict(DEFAULT_THRESHOLDS)
+        self.seed = seed
+
+    def run(self) -> Dict[str, Any]:
+        """Runs every scenario and returns the results in a JSON-serialisable form."""
+        results = {}
+        for scenario in self.scenarios:
+            name = f"events_{scenario['events']}_tasks_{scenario['tasks']}"
+            results[name] = self.run_scenario(
+                scenario["events"],
+                scenario["tasks"],
+                scenario.get("max_tasks_per_day", max(2, scenario["tasks"] // 20)),
+            )
+        return {
+            "meta": {
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "repeats": self.repeats,
+                "seed": self.seed,
+            },
+            "thresholds": self.thresholds,
+            "results": results,
+        }
+
+    def run_scenario(
+        self, n_events: int, n_tasks: int, max_tasks_per_day: int
+    ) -> Dict[str, Any]:
+        """Runs all benchmarks for a single calendar and deck size."""
+        generator = SyntheticDataGenerator(self.seed)
+        start_date = datetime(2025, 1, 6)
+        store = FakeGoogleCalendar()
+        descriptions = generator.build_calendar(
+            store, n_events, start_date, 10, max_tasks_per_day
+        )
+        calendar = self.build_google_calendar(store)
+        service = calendar.service
+        config = generator.build_config(
+            start_date.strftime("%Y-%m-%d"),
+            max_tasks_per_day=max_tasks_per_day,
+            tasks=generator.build_deck(n_tasks),
+        )
+        presenter = DataPresenter()
+        results = {}
+
+        with tempfile.TemporaryDirectory() as work_dir:
+            config["history_dir"] = os.path.join(work_dir, "history")
+            config_file = os.path.join(work_dir, "config.yaml")
+            with open(config_file, "w") as file:
+                yaml.dump(config, file)
+            scheduler = TaskScheduler(config_file, calendar, presenter)
+
+            def schedule():
+                scheduler.scheduled_tasks = {}
+                scheduler.create_scheduled_tasks()
+
+            results["create_scheduled_tasks"] = self.measure(service, schedule)
+            scheduled_tasks = scheduler.scheduled_tasks
+
+            results["count_tasks_in_description"] = self.measure(
+                service,
+                lambda: [scheduler.count_tasks_in_description(d) for d in descriptions],
+            )
+            results["prepare_tasks_display_data"] = self.measure(
+                service, lambda: presenter.prepare_tasks_display_data(scheduled_tasks)
+            )
+
+            history_dir = os.path.join(work_dir, "aggregate")
+            os.makedirs(history_dir)
+            history_files = generator.build_history_files(
+                history_dir, scheduled_tasks, n_files=10
+            )
+            scheduler.history_dir = history_dir
+            results["aggregate_undo_changes"] = self.measure(
+                service, lambda: scheduler.aggregate_undo_changes(history_files)
+            )
+            scheduler.history_dir = config["history_dir"]
+
+            results["add_tasks_to_calendar"] = []
+            results["undo_added_tasks"] = []
+            for _ in range(self.repeats):
+                results["add_tasks_to_calendar"].append(
+                    self.measure_once(service, scheduler.add_tasks_to_calendar)
+                )
+                history_id = scheduler.last_history_id
+                results["undo_added_tasks"].append(
+                    self.measure_once(
+                        service, lambda: scheduler.undo_added_tasks(history_id)
+                    )
+                )
+            results["add_tasks_to_calendar"] = self.summarise(
+                results["add_tasks_to_calendar"]
+            )
+            results["undo_added_tasks"] = self.summarise(results["undo_added_tasks"])
+
+        return results
+
+    def build_google_calendar(self, store: FakeGoogleCalendar) -> GoogleCalendar:
+        """
+        Builds a GoogleCalendar without authenticating, backed by the in-memory store.
+
+        The request scheduler never sleeps, so its throttling and retry bookkeeping is timed
+        without waiting on the rate limit.
+        """
+        calendar = GoogleCalendar.__new__(GoogleCalendar)
+        calendar.calendar_id = "primary"
+        calendar.credentials = None
+        calendar.service = FakeCalendarService(store)
+        calendar.request_scheduler = RequestScheduler(
+            clock=time.monotonic, sleep=lambda seconds: None
+        )
+        return calendar
+
+    def measure(self, service: FakeCalendarService, func: Callable) -> Dict[str, Any]:
+        """Runs a function several times and summarises its timings and API calls."""
+        return self.summarise(
+            [self.measure_once(service, func) for _ in range(self.repeats)]
+        )
+
+    def measure_once(self, service: FakeCalendarService, func: Callable):
+        """Runs a function once with output suppressed, returning elapsed seconds and API calls."""
+        service.reset_api_calls()
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+        return elapsed, dict(service.api_calls)
+
+    def summarise(self, samples: List) -> Dict[str, Any]:
+        """
+        Reduces timing samples to median and minimum, recording the highest API call count
+        of each method and whether every repeat made the same calls.
+        """
+        timings = [elapsed for elapsed, _ in samples]
+        api_calls = Counter()
+        for _, sample_calls in samples:
+            api_calls |= Counter(sample_calls)
+        return {
+            "median_seconds": statistics.median(timings),
+            "min_seconds": min(timings),
+            "api_calls": dict(api_calls),
+            "api_calls_consistent": all(
+                sample_calls == samples[0][1] for _, sample_calls in samples
+            ),
+        }
+
+    def save_results(self, results: Dict[str, Any], results_file: str) -> None:
+        """Saves benchmark results to a JSON file."""
+        with open(results_file, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+    def load_results(self, results_file: str) -> Dict[str, Any]:
+        """Loads benchmark results from a JSON file."""
+        with open(results_file, "r") as file:
+            return json.load(file)
+
+    def compare_results(
+        self, baseline: Dict[str, Any], current: Dict[str, Any]
+    ) -> List[str]:
+        """
+        Compares results with a baseline and returns a description of every regression.
+
+        Timings are compared by their minimum, which is the least noisy of the repeats, and
+        slowdowns smaller than min_time_delta_seconds are ignored. Thresholds from the baseline
+        apply to every benchmark unless overridden by name under its "benchmarks" key.
+        """
+        regressions = []
+        for scenario, benchmarks in current["results"].items():
+            for name, result in benchmarks.items():
+                previous = baseline["results"].get(scenario, {}).get(name)
+                if previous is None:
+                    continue
+
+                if not result.get("api_calls_consistent", True):
+                    regressions.append(
+                        f"{scenario}/{name}: API calls differ between repeats"
+                    )
+
+                thresholds = self.get_thresholds(baseline, name)
+                time_delta = result["min_seconds"] - previous["min_seconds"]
+                time_ratio = result["min_seconds"] / max(previous["min_seconds"], 1e-9)
+                if (
+                    time_ratio > thresholds["time_ratio"]
+                    and time_delta > thresholds["min_time_delta_seconds"]
+                ):
+                    regressions.append(
+                        f"{scenario}/{name}: {time_ratio:.2f}x slower "
+                        f"({previous['min_seconds']:.4f}s -> {result['min_seconds']:.4f}s)"
+                    )
+
+                for call, count in result["api_calls"].items():
+                    previous_count = previous["api_calls"].get(call, 0)
+                    if count > previous_count * thresholds["api_calls_ratio"]:
+                        regressions.append(
+                            f"{scenario}/{name}: {call} calls {previous_count} -> {count}"
+                        )
+        return regressions
+
+    def get_thresholds(self, baseline: Dict[str, Any], name: str) -> Dict[str, Any]:
+        """Returns the regression thresholds for a benchmark, applying per-benchmark overrides."""
+        thresholds = dict(DEFAULT_THRESHOLDS, **baseline.get("thresholds", {}))
+        thresholds.update(thresholds["benchmarks"].get(name, {}))
+        return thresholds
@@ -3,7 +3,9 @@ from googleapiclient.discovery import build
 from google.auth.transport.requests import Request
 import os
 import pickle
+import uuid
 from datetime import datetime, timezone
+from src.request_scheduler import RequestScheduler
 
 
 class GoogleCalendar:
@@ -11,14 +13,16 @@ class GoogleCalendar:
     Manages interactions with the Google Calendar API, including authentication, and creating, updating, and deleting events.
     """
 
-    def __init__(self, calendar_id, credentials_file):
+    def __init__(self, calendar_id, credentials_file, request_scheduler=None):
         """
         Initializes the GoogleCalendar instance with credentials and sets up the Google Calendar service.
 
         :param calendar_id: The ID of the Google Calendar to manage.
         :param credentials_file: Path to the OAuth 2.0 client secrets file.
+        :param request_scheduler: Scheduler that throttles and retries API requests, a default one is used if omitted.
         """
         self.calendar_id = calendar_id
+        self.request_scheduler = request_scheduler or RequestScheduler()
         self.credentials = None
         self.service = None
 
@@ -49,13 +53,18 @@ class GoogleCalendar:
         """
         Creates a new event in the Google Calendar.
 
+        The event ID is generated up front so that a retried insert whose earlier attempt
+        already succeeded returns the existing event instead of creating a duplicate.
+
         :param summary: The summary or title of the event.
         :param description: The description of the event.
         :param start_time: The start time of the event in RFC3339 format.
         :param end_time: The end time of the event in RFC3339 format.
         :return: The created event object.
         """
+        event_id = uuid.uuid4().hex
         event = {
+            "id": event_id,
             "summary": summary,
             "description": description,
             "start": {"dateTime": start_time, "timeZone": "Europe/Warsaw"},
@@ -63,10 +72,11 @@ class GoogleCalendar:
             "colorId": "8",
         }
 
-        created_event = (
-            self.service.events()
-            .insert(calendarId=self.calendar_id, body=event)
-            .execute()
+        created_event = self.request_scheduler.execute(
+            self.service.events().insert(calendarId=self.calendar_id, body=event),
+            on_retry_conflict=lambda: self.request_scheduler.execute(
+                self.service.events().get(calendarId=self.calendar_id, eventId=event_id)
+            ),
         )
         return created_event
 
@@ -78,10 +88,10 @@ class GoogleCalendar:
         :param update_body: A dictionary containing the event attributes to update.
         :return: The updated event object.
         """
-        updated_event = (
-            self.service.events()
-            .update(calendarId=self.calendar_id, eventId=event_id, body=update_body)
-            .execute()
+        updated_event = self.request_scheduler.execute(
+            self.service.events().update(
+                calendarId=self.calendar_id, eventId=event_id, body=update_body
+            )
         )
         return updated_event
 
@@ -89,11 +99,15 @@ class GoogleCalendar:
         """
         Deletes an event from the Google Calendar.
 
+        A retried delete that finds the event already gone is treated as successful,
+        since an earlier attempt must have deleted it.
+
         :param event_id: The ID of the event to delete.
         """
-        self.service.events().delete(
-            calendarId=self.calendar_id, eventId=event_id
-        ).execute()
+        self.request_scheduler.execute(
+            self.service.events().delete(calendarId=self.calendar_id, eventId=event_id),
+            on_retry_not_found=lambda: None,
+        )
 
     def get_events(self, start_date, end_date):
         """
@@ -102,25 +116,20 @@ class GoogleCalendar:
         :param start_date: The start date for the events query in YYYY-MM-DD format.
         :param end_date: The end date for the events query in YYYY-MM-DD format.
         :return: A list of event objects within the specified date range.
+        :raises HttpError: If the events cannot be fetched, so an outage is not mistaken for an empty day.
         """
         start_datetime = datetime.fromisoformat(start_date).replace(tzinfo=timezone.utc)
         end_datetime = datetime.fromisoformat(end_date).replace(tzinfo=timezone.utc)
         start_date_str = start_datetime.isoformat()
         end_date_str = end_datetime.isoformat()
 
-        try:
-            events_result = (
-                self.service.events()
-                .list(
-                    calendarId=self.calendar_id,
-                    timeMin=start_date_str,
-                    timeMax=end_date_str,
-                    singleEvents=True,
-                    orderBy="startTime",
-                )
-                .execute()
+        events_result = self.request_scheduler.execute(
+            self.service.events().list(
+                calendarId=self.calendar_id,
+                timeMin=start_date_str,
+                timeMax=end_date_str,
+                singleEvents=True,
+                orderBy="startTime",
             )
-            return events_result.get("items", [])
-        except Exception as e:
-            print("An error occurred while fetching events:", e)
-            return []
+        )
+        return events_result.get("items", [])
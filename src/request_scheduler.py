@@ -0,0 +1,136 @@
+from googleapiclient.errors import HttpError
+import random
+import time
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+
+
+class RequestScheduler:
+    """
+    Throttles and retries Google Calendar API requests, using a token bucket whose rate adapts to the observed quota.
+    """
+
+    def __init__(
+        self,
+        rate=5.0,
+        max_rate=10.0,
+        min_rate=0.5,
+        burst=10,
+        rate_increase=0.1,
+        max_retries=6,
+        base_delay=1.0,
+        max_delay=64.0,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        """
+        Initializes the request scheduler with throttling and retry settings.
+
+        :param rate: Initial number of requests allowed per second.
+        :param max_rate: Upper bound the rate may grow to after successful requests.
+        :param min_rate: Lower bound the rate may shrink to after rate-limit errors.
+        :param burst: Maximum number of requests that may be sent back to back.
+        :param rate_increase: Requests per second added to the rate after each success.
+        :param max_retries: Number of retries before a retryable error is raised.
+        :param base_delay: Backoff delay in seconds before the first retry.
+        :param max_delay: Upper bound of the backoff delay in seconds.
+        :param clock: Function returning monotonic time in seconds.
+        :param sleep: Function used to wait for the given number of seconds.
+        """
+        self.rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.burst = burst
+        self.rate_increase = rate_increase
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = float(burst)
+        self.last_refill = clock()
+
+    def execute(self, request, on_retry_conflict=None, on_retry_not_found=None):
+        """
+        Executes an API request, waiting for the rate limit and retrying transient errors.
+
+        :param request: A googleapiclient request object exposing execute().
+        :param on_retry_conflict: Called instead of raising when a retried request gets a 409,
+            meaning an earlier attempt already succeeded; its result is returned.
+        :param on_retry_not_found: Called instead of raising when a retried request gets a 404
+            or 410, meaning an earlier delete already succeeded; its result is returned.
+        :return: The response returned by the request.
+        :raises HttpError: If the error is not retryable or retries are exhausted.
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                response = request.execute()
+            except HttpError as error:
+                if (
+                    error.resp.status == 409
+                    and attempt > 0
+                    and on_retry_conflict is not None
+                ):
+                    return on_retry_conflict()
+                if (
+                    error.resp.status in (404, 410)
+                    and attempt > 0
+                    and on_retry_not_found is not None
+                ):
+                    return on_retry_not_found()
+                if not self.is_retryable(error) or attempt >= self.max_retries:
+                    raise
+                if self.is_rate_limited(error):
+                    self.decrease_rate()
+                self.sleep(self.get_backoff_delay(attempt, error))
+                attempt += 1
+            else:
+                self.increase_rate()
+                return response
+
+    def acquire(self):
+        """Waits until a token is available in the bucket and consumes it."""
+        self.refill()
+        if self.tokens < 1:
+            self.sleep((1 - self.tokens) / self.rate)
+            self.refill()
+        self.tokens -= 1
+
+    def refill(self):
+        """Adds tokens accumulated since the last refill, up to the burst size."""
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def increase_rate(self):
+        """Raises the rate additively after a successful request."""
+        self.rate = min(self.max_rate, self.rate + self.rate_increase)
+
+    def decrease_rate(self):
+        """Halves the rate and empties the bucket after a rate-limit error."""
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.tokens = 0.0
+
+    def get_backoff_delay(self, attempt, error):
+        """Returns the delay before the next retry, honouring a Retry-After header if present."""
+        retry_after = error.resp.get("retry-after")
+        if retry_after and retry_after.isdigit():
+            return min(self.max_delay, float(retry_after))
+        delay = min(self.max_delay, self.base_delay * 2**attempt)
+        return random.uniform(delay / 2, delay)
+
+    def is_retryable(self, error):
+        """Checks if an error is a transient server or rate-limit error worth retrying."""
+        return error.resp.status in RETRYABLE_STATUSES or self.is_rate_limited(error)
+
+    def is_rate_limited(self, error):
+        """Checks if an error signals that the API quota rate was exceeded."""
+        if error.resp.status == 429:
+            return True
+        content = error.content.decode("utf-8", errors="ignore")
+        return error.resp.status == 403 and any(
+            reason in content for reason in RATE_LIMIT_REASONS
+        )
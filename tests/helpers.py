@@ -0,0 +1,38 @@
+import httplib2
+from googleapiclient.errors import HttpError
+
+
+class FakeClock:
+    """Fake monotonic clock advanced only by the scheduler's sleep calls."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeRequest:
+    """Fake API request raising the given errors before returning a response."""
+
+    def __init__(self, errors=(), response=None):
+        self.errors = list(errors)
+        self.response = response if response is not None else {"id": "event1"}
+        self.calls = 0
+
+    def execute(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.response
+
+
+def make_error(status, reason="", headers=None):
+    resp = httplib2.Response(dict({"status": status}, **(headers or {})))
+    content = f'{{"error": {{"errors": [{{"reason": "{reason}"}}]}}}}'.encode()
+    return HttpError(resp, content)
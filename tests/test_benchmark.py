@@ -0,0 +1,210 @@
+import pytest
+
+from src.benchmark import (
+    BenchmarkRunner,
+    FakeCalendarService,
+    FakeGoogleCalendar,
+)
+
+
+@pytest.fixture
+def calendar():
+    calendar = FakeGoogleCalendar()
+    calendar.add_event(
+        "#Zadania", "- Linux", "2025-01-06T08:00:00", "2025-01-06T09:00:00"
+    )
+    calendar.add_event("Gym", "", "2025-01-06T23:59:30", "2025-01-07T00:30:00")
+    calendar.add_event("Meeting", "", "2025-01-07T10:00:00", "2025-01-07T11:00:00")
+    return calendar
+
+
+def summaries(events):
+    return [event["summary"] for event in events]
+
+
+def test_get_events_filters_by_start_time(calendar):
+    events = calendar.get_events("2025-01-06T00:00:00", "2025-01-06T23:59:00")
+
+    assert summaries(events) == ["#Zadania"]
+    assert calendar.api_calls == {"get_events": 1}
+
+
+def test_get_events_spans_days_in_start_order(calendar):
+    events = calendar.get_events("2025-01-06", "2025-01-08")
+
+    assert summaries(events) == ["#Zadania", "Gym", "Meeting"]
+
+
+def test_seeded_events_are_not_counted_as_api_calls(calendar):
+    assert calendar.api_calls == {}
+
+
+def test_update_event_reindexes_moved_event(calendar):
+    event = calendar.get_events("2025-01-06", "2025-01-07")[0]
+    update_body = dict(event, start={"dateTime": "2025-01-07T08:00:00"})
+
+    calendar.update_event(event["id"], update_body)
+
+    assert summaries(calendar.get_events("2025-01-06", "2025-01-07")) == ["Gym"]
+    assert summaries(calendar.get_events("2025-01-07", "2025-01-08")) == [
+        "#Zadania",
+        "Meeting",
+    ]
+    assert calendar.api_calls["update_event"] == 1
+
+
+def test_delete_event_removes_event(calendar):
+    event = calendar.get_events("2025-01-07", "2025-01-08")[0]
+
+    calendar.delete_event(event["id"])
+
+    assert calendar.get_events("2025-01-07", "2025-01-08") == []
+    assert calendar.api_calls["delete_event"] == 1
+
+
+def test_create_event_is_counted_and_retrievable(calendar):
+    calendar.create_event(
+        "#Zadania", "- Python", "2025-01-08T08:00:00", "2025-01-08T08:00:00"
+    )
+
+    assert summaries(calendar.get_events("2025-01-08", "2025-01-09")) == ["#Zadania"]
+    assert calendar.api_calls["create_event"] == 1
+
+
+def test_service_counts_calls_when_requests_execute(calendar):
+    service = FakeCalendarService(calendar)
+    request = service.events().list(
+        calendarId="primary",
+        timeMin="2025-01-06T00:00:00+00:00",
+        timeMax="2025-01-06T23:59:00+00:00",
+    )
+    assert service.api_calls == {}
+
+    assert summaries(request.execute()["items"]) == ["#Zadania"]
+    assert service.api_calls == {"events.list": 1}
+    assert calendar.api_calls == {}
+
+
+def test_service_insert_keeps_client_id_and_supports_get(calendar):
+    service = FakeCalendarService(calendar)
+    body = {
+        "id": "abc123",
+        "summary": "#Zadania",
+        "start": {"dateTime": "2025-01-08T08:00:00"},
+    }
+
+    service.events().insert(calendarId="primary", body=body).execute()
+
+    event = service.events().get(calendarId="primary", eventId="abc123").execute()
+    assert event["summary"] == "#Zadania"
+
+
+def test_service_update_and_delete_modify_calendar(calendar):
+    service = FakeCalendarService(calendar)
+    event = calendar.find_events("2025-01-07", "2025-01-08")[0]
+
+    service.events().update(
+        calendarId="primary", eventId=event["id"], body=dict(event, summary="Call")
+    ).execute()
+    assert summaries(calendar.find_events("2025-01-07", "2025-01-08")) == ["Call"]
+
+    service.events().delete(calendarId="primary", eventId=event["id"]).execute()
+    assert calendar.find_events("2025-01-07", "2025-01-08") == []
+    assert service.api_calls == {"events.update": 1, "events.delete": 1}
+
+
+def make_results(min_seconds, api_calls=None, thresholds=None):
+    results = {
+        "results": {
+            "scenario": {
+                "bench": {
+                    "min_seconds": min_seconds,
+                    "median_seconds": min_seconds,
+                    "api_calls": api_calls or {},
+                }
+            }
+        }
+    }
+    if thresholds is not None:
+        results["thresholds"] = thresholds
+    return results
+
+
+@pytest.fixture
+def runner():
+    return BenchmarkRunner([])
+
+
+def test_compare_results_reports_time_regression(runner):
+    regressions = runner.compare_results(make_results(1.0), make_results(1.5))
+
+    assert regressions == ["scenario/bench: 1.50x slower (1.0000s -> 1.5000s)"]
+
+
+def test_compare_results_ignores_slowdown_within_ratio(runner):
+    assert runner.compare_results(make_results(1.0), make_results(1.2)) == []
+
+
+def test_compare_results_ignores_slowdown_below_absolute_floor(runner):
+    assert runner.compare_results(make_results(0.002), make_results(0.006)) == []
+
+
+def test_compare_results_applies_per_benchmark_thresholds(runner):
+    baseline = make_results(
+        1.0, thresholds={"benchmarks": {"bench": {"time_ratio": 2.0}}}
+    )
+
+    assert runner.compare_results(baseline, make_results(1.5)) == []
+
+
+def test_compare_results_reports_api_call_regression(runner):
+    regressions = runner.compare_results(
+        make_results(1.0, {"get_events": 10}),
+        make_results(1.0, {"get_events": 11, "update_event": 1}),
+    )
+
+    assert regressions == [
+        "scenario/bench: get_events calls 10 -> 11",
+        "scenario/bench: update_event calls 0 -> 1",
+    ]
+
+
+def test_summarise_keeps_consistent_api_calls(runner):
+    summary = runner.summarise([(2.0, {"events.list": 3}), (1.0, {"events.list": 3})])
+
+    assert summary["min_seconds"] == 1.0
+    assert summary["api_calls"] == {"events.list": 3}
+    assert summary["api_calls_consistent"]
+
+
+def test_summarise_records_maximum_of_drifting_api_calls(runner):
+    summary = runner.summarise(
+        [(1.0, {"events.list": 3}), (1.0, {"events.list": 5, "events.delete": 1})]
+    )
+
+    assert summary["api_calls"] == {"events.list": 5, "events.delete": 1}
+    assert not summary["api_calls_consistent"]
+
+
+def test_compare_results_reports_api_call_drift(runner):
+    current = make_results(1.0, {"events.list": 3})
+    current["results"]["scenario"]["bench"]["api_calls_consistent"] = False
+
+    regressions = runner.compare_results(make_results(1.0, {"events.list": 3}), current)
+
+    assert regressions == ["scenario/bench: API calls differ between repeats"]
+
+
+def test_compare_results_skips_benchmarks_missing_from_baseline(runner):
+    baseline = {"results": {}}
+
+    assert runner.compare_results(baseline, make_results(100.0)) == []
+
+
+def test_run_scenario_exercises_create_and_delete_paths():
+    results = BenchmarkRunner([], repeats=1).run_scenario(200, 20, 4)
+
+    assert results["add_tasks_to_calendar"]["api_calls"]["events.insert"] > 0
+    assert results["add_tasks_to_calendar"]["api_calls"]["events.update"] > 0
+    assert results["undo_added_tasks"]["api_calls"]["events.delete"] > 0
+    assert results["undo_added_tasks"]["api_calls"]["events.update"] > 0
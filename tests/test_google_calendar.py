@@ -0,0 +1,81 @@
+import pytest
+from googleapiclient.errors import HttpError
+
+from src.google_calendar import GoogleCalendar
+from src.request_scheduler import RequestScheduler
+from tests.helpers import FakeClock, FakeRequest, make_error
+
+
+class FakeEvents:
+    """Fake events() resource returning preconfigured requests."""
+
+    def __init__(self, requests):
+        self.requests = requests
+        self.inserted = []
+
+    def list(self, **kwargs):
+        return self.requests["list"]
+
+    def insert(self, calendarId, body):
+        self.inserted.append(body)
+        return self.requests["insert"]
+
+    def get(self, calendarId, eventId):
+        return FakeRequest(response={"id": eventId})
+
+    def delete(self, calendarId, eventId):
+        return self.requests["delete"]
+
+
+class FakeService:
+    def __init__(self, requests):
+        self.fake_events = FakeEvents(requests)
+
+    def events(self):
+        return self.fake_events
+
+
+def make_calendar(requests):
+    clock = FakeClock()
+    calendar = GoogleCalendar.__new__(GoogleCalendar)
+    calendar.calendar_id = "primary"
+    calendar.service = FakeService(requests)
+    calendar.request_scheduler = RequestScheduler(clock=clock, sleep=clock.sleep)
+    return calendar
+
+
+def test_get_events_raises_instead_of_returning_empty_list():
+    calendar = make_calendar({"list": FakeRequest([make_error(404, "notFound")])})
+
+    with pytest.raises(HttpError):
+        calendar.get_events("2025-01-06T00:00:00", "2025-01-06T23:59:00")
+
+
+def test_get_events_returns_items():
+    calendar = make_calendar({"list": FakeRequest(response={"items": [{"id": "a"}]})})
+
+    assert calendar.get_events("2025-01-06T00:00:00", "2025-01-06T23:59:00") == [
+        {"id": "a"}
+    ]
+
+
+def test_create_event_returns_existing_event_after_retried_conflict():
+    insert = FakeRequest([make_error(503), make_error(409, "duplicate")])
+    calendar = make_calendar({"insert": insert})
+
+    event = calendar.create_event(
+        "#Zadania", "- Linux", "2025-01-06T08:00:00", "2025-01-06T08:00:00"
+    )
+
+    sent_body = calendar.service.fake_events.inserted[0]
+    assert event == {"id": sent_body["id"]}
+    assert insert.calls == 2
+
+
+def test_delete_event_succeeds_when_retry_finds_event_gone():
+    delete = FakeRequest([make_error(503), make_error(410, "deleted")])
+    calendar = make_calendar({"delete": delete})
+
+    calendar.delete_event("event1")
+
+    assert delete.calls == 2
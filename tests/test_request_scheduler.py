@@ -0,0 +1,150 @@
+import pytest
+from googleapiclient.errors import HttpError
+
+from src.request_scheduler import RequestScheduler
+from tests.helpers import FakeClock, FakeRequest, make_error
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def scheduler(clock):
+    return RequestScheduler(rate=4.0, burst=4, clock=clock, sleep=clock.sleep)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        make_error(429),
+        make_error(503),
+        make_error(403, "rateLimitExceeded"),
+        make_error(403, "userRateLimitExceeded"),
+    ],
+)
+def test_execute_retries_transient_errors(scheduler, error):
+    request = FakeRequest([error])
+
+    assert scheduler.execute(request) == {"id": "event1"}
+    assert request.calls == 2
+
+
+@pytest.mark.parametrize(
+    "error", [make_error(404, "notFound"), make_error(403, "quotaExceeded")]
+)
+def test_execute_raises_unrecoverable_errors(scheduler, error):
+    request = FakeRequest([error])
+
+    with pytest.raises(HttpError):
+        scheduler.execute(request)
+    assert request.calls == 1
+
+
+def test_execute_raises_after_max_retries(clock):
+    scheduler = RequestScheduler(max_retries=2, clock=clock, sleep=clock.sleep)
+    request = FakeRequest([make_error(500)] * 5)
+
+    with pytest.raises(HttpError):
+        scheduler.execute(request)
+    assert request.calls == 3
+
+
+def test_execute_honours_retry_after(scheduler, clock):
+    request = FakeRequest([make_error(503, headers={"retry-after": "7"})])
+
+    scheduler.execute(request)
+
+    assert clock.sleeps == [7.0]
+
+
+def test_backoff_grows_exponentially_with_jitter(scheduler):
+    error = make_error(503)
+
+    for attempt in range(4):
+        delay = scheduler.get_backoff_delay(attempt, error)
+        assert 2**attempt / 2 <= delay <= 2**attempt
+
+
+def test_rate_limit_error_halves_rate(scheduler):
+    scheduler.execute(FakeRequest([make_error(429)]))
+
+    assert scheduler.rate == pytest.approx(2.0 + scheduler.rate_increase)
+
+
+def test_rate_does_not_drop_below_min_rate(clock):
+    scheduler = RequestScheduler(
+        rate=1.0, min_rate=0.5, max_retries=5, clock=clock, sleep=clock.sleep
+    )
+
+    with pytest.raises(HttpError):
+        scheduler.execute(FakeRequest([make_error(429)] * 6))
+    assert scheduler.rate == 0.5
+
+
+def test_success_increases_rate_up_to_max_rate(clock):
+    scheduler = RequestScheduler(
+        rate=1.0, max_rate=1.25, rate_increase=0.1, clock=clock, sleep=clock.sleep
+    )
+
+    scheduler.execute(FakeRequest())
+    assert scheduler.rate == pytest.approx(1.1)
+
+    for _ in range(5):
+        scheduler.execute(FakeRequest())
+    assert scheduler.rate == 1.25
+
+
+def test_bucket_allows_burst_then_waits_for_tokens(clock):
+    scheduler = RequestScheduler(
+        rate=2.0, max_rate=2.0, burst=3, clock=clock, sleep=clock.sleep
+    )
+
+    for _ in range(3):
+        scheduler.acquire()
+    assert clock.sleeps == []
+
+    scheduler.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_bucket_refills_over_time_up_to_burst(scheduler, clock):
+    scheduler.tokens = 0.0
+    clock.now += 10
+
+    scheduler.refill()
+
+    assert scheduler.tokens == scheduler.burst
+
+
+def test_retried_conflict_uses_callback(scheduler):
+    request = FakeRequest([make_error(503), make_error(409, "duplicate")])
+
+    result = scheduler.execute(request, on_retry_conflict=lambda: {"id": "existing"})
+
+    assert result == {"id": "existing"}
+
+
+@pytest.mark.parametrize("status", [404, 410])
+def test_retried_not_found_uses_callback(scheduler, status):
+    request = FakeRequest([make_error(503), make_error(status, "deleted")])
+
+    result = scheduler.execute(request, on_retry_not_found=lambda: "gone")
+
+    assert result == "gone"
+    assert request.calls == 2
+
+
+def test_first_attempt_not_found_is_raised(scheduler):
+    request = FakeRequest([make_error(404, "notFound")])
+
+    with pytest.raises(HttpError):
+        scheduler.execute(request, on_retry_not_found=lambda: "gone")
+
+
+def test_first_attempt_conflict_is_raised(scheduler):
+    request = FakeRequest([make_error(409, "duplicate")])
+
+    with pytest.raises(HttpError):
+        scheduler.execute(request, on_retry_conflict=lambda: {"id": "existing"})